@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+    tests.conftest
+    --------------
+
+    Provides fixtures for weppy-REST tests
+
+    :copyright: (c) 2017 by Giovanni Barillari
+    :license: BSD, see LICENSE for more details.
+"""
+
+import os
+import shutil
+import sqlite3
+import pytest
+
+from datetime import datetime
+from weppy import App, sdict
+from weppy.orm import Database, Model, Field, belongs_to, has_many
+from weppy_rest import REST
+
+
+class User(Model):
+    tablename = 'users'
+    has_many('tasks')
+
+    name = Field.string()
+
+
+class Task(Model):
+    belongs_to('user')
+
+    title = Field.string()
+    is_completed = Field.bool(default=False)
+    created_at = Field.datetime()
+
+
+def _seed(db):
+    with db.connection():
+        user = User.create(name='walter').id
+        for idx in range(3):
+            Task.create(
+                title='task %s' % idx, user=user, is_completed=bool(idx % 2),
+                created_at=datetime(2017, 1, 1 + idx, 10, 30))
+        db.commit()
+
+
+@pytest.fixture(scope='session')
+def app(tmpdir_factory):
+    rv = App(__name__, root_path=str(tmpdir_factory.mktemp('app')))
+    rv.config.db.uri = 'sqlite://primary.db'
+    rv.config.db.auto_migrate = True
+    rv.use_extension(REST)
+    return rv
+
+
+@pytest.fixture(scope='session')
+def db(app):
+    rv = Database(app)
+    rv.define_models(User, Task)
+    app.pipeline = [rv.pipe]
+    _seed(rv)
+    return rv
+
+
+@pytest.fixture(scope='session')
+def replicas(app, db):
+    rv = []
+    folder = os.path.join(app.root_path, 'databases')
+    for idx in range(2):
+        path = os.path.join(folder, 'replica%s.db' % idx)
+        shutil.copy(os.path.join(folder, 'primary.db'), path)
+        #: mark replicas contents to know who answered
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "UPDATE tasks SET title = 'replica %s ' || title" % idx)
+        conn.commit()
+        conn.close()
+        rv.append(Database(app, config=sdict(
+            uri='sqlite://replica%s.db' % idx, auto_migrate=False)))
+    return rv
+
+
+@pytest.fixture(scope='session')
+def client(app, db):
+    return app.test_client()
+
+
+@pytest.fixture(scope='session')
+def models(db):
+    return sdict(User=User, Task=Task)
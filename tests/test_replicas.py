@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+    tests.replicas
+    --------------
+
+    Test read replicas routing
+
+    :copyright: (c) 2017 by Giovanni Barillari
+    :license: BSD, see LICENSE for more details.
+"""
+
+import json
+import pytest
+
+from datetime import datetime
+
+from weppy_rest import RESTModule
+
+
+@pytest.fixture
+def rest_module(app, models, replicas, request):
+    def builder(**kwargs):
+        name = request.node.name.replace('test_', '')
+        kwargs.setdefault('read_replicas', replicas)
+        return app.rest_module(
+            __name__, name, models.Task, url_prefix=name, **kwargs)
+    return builder
+
+
+def _get(client, path):
+    rv = client.get(path)
+    assert rv.status.startswith('200')
+    return json.loads(rv.data)
+
+
+def _titles(db, models):
+    with db.connection():
+        return models.Task.all().select(orderby=models.Task.id).column(
+            'title')
+
+
+def test_mirrored_tables(rest_module, replicas):
+    rest_module()
+    for replica in replicas:
+        assert 'tasks' in replica
+        assert 'users' in replica
+
+
+def test_round_robin(rest_module, client):
+    rest_module()
+    titles = [
+        _get(client, '/round_robin/1')['title'] for _ in range(4)]
+    assert titles == [
+        'replica 0 task 0', 'replica 1 task 0',
+        'replica 0 task 0', 'replica 1 task 0']
+    data = _get(client, '/round_robin')['data']
+    assert [row['title'] for row in data] == [
+        'replica 0 task 0', 'replica 0 task 1', 'replica 0 task 2']
+
+
+def test_reference_fields(rest_module, client):
+    rest_module()
+    assert _get(client, '/reference_fields/1')['user'] == 1
+    assert _get(client, '/reference_fields')['data'][0]['user'] == 1
+
+
+def test_no_replicas(rest_module, client):
+    rest_module(read_replicas=[])
+    assert _get(client, '/no_replicas/1')['title'] == 'task 0'
+
+
+def test_writes_on_primary(rest_module, client, db, replicas, models):
+    rest_module()
+    rv = client.post('/writes_on_primary', data={
+        'title': 'new task', 'user': 1, 'created_at': '2017-02-01 10:30:00'})
+    assert rv.status.startswith('201')
+    rid = json.loads(rv.data)['id']
+    rv = client.put(
+        '/writes_on_primary/%s' % rid, data={'title': 'edited task'})
+    assert rv.status.startswith('200')
+    assert json.loads(rv.data)['title'] == 'edited task'
+    assert 'edited task' in _titles(db, models)
+    for replica in replicas:
+        with replica.connection():
+            assert not replica(replica.tasks.id == rid).count()
+    rv = client.delete('/writes_on_primary/%s' % rid)
+    assert rv.status.startswith('200')
+    assert 'edited task' not in _titles(db, models)
+
+
+def test_sticky_after_write(rest_module, client, db, models):
+    mod = rest_module(enabled_methods=[])
+
+    @mod.index()
+    def index(dbset):
+        before = dbset.where(models.Task.id == 1).select().first().title
+        models.Task.create(
+            title='sticky task', user=1, is_completed=False,
+            created_at=datetime(2017, 2, 1, 10, 30))
+        after = dbset.where(models.Task.id == 1).select().first().title
+        count = dbset.where(models.Task.title == 'sticky task').count()
+        return {'before': before, 'after': after, 'count': count}
+
+    rv = _get(client, '/sticky_after_write')
+    assert rv == {
+        'before': 'replica 0 task 0', 'after': 'task 0', 'count': 1}
+    #: stickiness should not leak to next requests
+    rv = _get(client, '/sticky_after_write')
+    assert rv['before'] == 'replica 1 task 0'
+    with db.connection():
+        models.Task.where(lambda t: t.title == 'sticky task').delete()
+        db.commit()
+
+
+def test_sticky_after_naive_update(rest_module, client, db, models):
+    mod = rest_module(enabled_methods=[])
+
+    @mod.index()
+    def index(dbset):
+        dbset.where(models.Task.id == 2).update_naive(title='naive task')
+        return {'title': dbset.where(models.Task.id == 2).select(
+            ).first().title}
+
+    assert _get(client, '/sticky_after_naive_update') == {
+        'title': 'naive task'}
+    with db.connection():
+        models.Task.where(lambda t: t.id == 2).update(title='task 1')
+        db.commit()
+
+
+def test_sticky_after_other_table_write(rest_module, client, db, models):
+    mod = rest_module(enabled_methods=[])
+
+    @mod.index()
+    def index(dbset):
+        before = dbset.where(models.Task.id == 1).select().first().title
+        models.User.create(name='jesse')
+        after = dbset.where(models.Task.id == 1).select().first().title
+        return {'before': before, 'after': after}
+
+    assert _get(client, '/sticky_after_other_table_write') == {
+        'before': 'replica 0 task 0', 'after': 'task 0'}
+    with db.connection():
+        models.User.where(lambda u: u.name == 'jesse').delete()
+        db.commit()
+
+
+def test_use_primary(rest_module, client, models):
+    mod = rest_module(enabled_methods=[])
+
+    @mod.read()
+    def read(row):
+        mod.use_primary()
+        return {'title': row.title}
+
+    @mod.index()
+    def index(dbset):
+        mod.use_primary()
+        return {'title': dbset.where(models.Task.id == 1).select(
+            ).first().title}
+
+    assert _get(client, '/use_primary/1')['title'] == 'replica 0 task 0'
+    assert _get(client, '/use_primary')['title'] == 'task 0'
+
+
+def test_custom_replica(rest_module, client, replicas):
+    mod = rest_module()
+
+    @mod.get_replica
+    def pick_replica():
+        return replicas[1]
+
+    titles = [
+        _get(client, '/custom_replica/1')['title'] for _ in range(3)]
+    assert titles == ['replica 1 task 0'] * 3
+
+
+def test_joined_set_on_primary(rest_module, client, models):
+    mod = rest_module(enabled_methods=[])
+
+    @mod.get_dbset
+    def fetch_tasks():
+        return models.Task.all().join('user')
+
+    @mod.index()
+    def index(dbset):
+        return mod.serialize_many(dbset.select())
+
+    data = _get(client, '/joined_set_on_primary')['data']
+    assert [row['title'] for row in data] == ['task 0', 'task 1', 'task 2']
+
+
+def test_module_class(app, models, replicas):
+    mod = app.rest_module(
+        __name__, 'module_class', models.Task, url_prefix='module_class',
+        read_replicas=replicas, module_class=RESTModule)
+    assert mod.read_replicas == replicas
+
+
+def test_module_class_baseline_signature(app, models):
+    class BaselineRESTModule(RESTModule):
+        @classmethod
+        def from_app(
+            cls, app, import_name, name, model, serializer, parser,
+            enabled_methods, disabled_methods, list_envelope,
+            single_envelope, use_envelope_on_parsing, url_prefix, hostname
+        ):
+            return cls(
+                app, name, import_name, model, serializer, parser,
+                enabled_methods, disabled_methods, list_envelope,
+                single_envelope, use_envelope_on_parsing, url_prefix,
+                hostname)
+
+    mod = app.rest_module(
+        __name__, 'module_class_baseline', models.Task,
+        url_prefix='module_class_baseline', module_class=BaselineRESTModule)
+    assert mod.read_replicas == []
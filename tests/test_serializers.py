@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+    tests.serializers
+    -----------------
+
+    Test serialization over selects
+
+    :copyright: (c) 2017 by Giovanni Barillari
+    :license: BSD, see LICENSE for more details.
+"""
+
+import json
+import tracemalloc
+import pytest
+
+from datetime import datetime
+from weppy.cache import RamCache
+from weppy.orm.objects import Set
+from weppy_rest import RESTModule, Serializer, serialize, serialize_select
+from weppy_rest import serializers as serializers_module
+
+
+class PlainSerializer(Serializer):
+    attributes = ['id', 'title', 'is_completed', 'created_at', 'user']
+
+
+class MethodSerializer(PlainSerializer):
+    def upper_title(self, row, **extras):
+        return row.title.upper()
+
+
+class BoundSerializer(PlainSerializer):
+    bind_to = 'tasks'
+
+
+class DunderSerializer(PlainSerializer):
+    def __serialize__(self, row, **extras):
+        rv = super(DunderSerializer, self).__serialize__(row, **extras)
+        rv['extra'] = 1
+        return rv
+
+
+class CallSerializer(PlainSerializer):
+    def __call__(self, row, **extras):
+        rv = self.__serialize__(row, **extras)
+        rv['extra'] = 1
+        return rv
+
+
+class VirtualSerializer(Serializer):
+    attributes = ['id', 'title']
+    include = ['tasks']
+
+
+@pytest.fixture
+def plain_calls(monkeypatch):
+    calls = []
+    builder = serializers_module._build_plain_processor
+
+    def tracked(*args, **kwargs):
+        calls.append(args)
+        return builder(*args, **kwargs)
+    monkeypatch.setattr(serializers_module, '_build_plain_processor', tracked)
+    return calls
+
+
+@pytest.fixture
+def many_tasks(db, models):
+    with db.connection():
+        for idx in range(200):
+            models.Task.create(
+                title='bulk %s' % idx, user=1, is_completed=bool(idx % 2),
+                created_at=datetime(2017, 3, 1, 10, idx % 60))
+        db.commit()
+    yield
+    with db.connection():
+        models.Task.where(lambda t: t.title.startswith('bulk ')).delete()
+        db.commit()
+
+
+def test_plain_flag(models):
+    assert PlainSerializer(models.Task)._plain_
+    assert Serializer(models.Task)._plain_
+    for serializer_class in (
+        MethodSerializer, BoundSerializer, DunderSerializer, CallSerializer
+    ):
+        assert not serializer_class(models.Task)._plain_
+    assert not VirtualSerializer(models.User)._plain_
+
+
+def test_plain_output(db, models, plain_calls):
+    serializer = PlainSerializer(models.Task)
+    with db.connection():
+        dbset = models.Task.all()
+        rv = serialize_select(dbset, serializer)
+        expected = serialize(dbset.select(), serializer)
+    assert len(plain_calls) == 1
+    assert rv == expected
+    assert rv[0]['created_at'] == datetime(2017, 1, 1, 10, 30)
+    assert rv[0]['is_completed'] is False
+    assert rv[1]['is_completed'] is True
+    assert rv[0]['user'] == 1
+    assert json.dumps(rv[0]['user']) == '1'
+
+
+def test_plain_pagination(db, models, plain_calls):
+    serializer = PlainSerializer(models.Task)
+    with db.connection():
+        dbset = models.Task.all()
+        rv = serialize_select(dbset, serializer, paginate=(2, 2))
+        expected = serialize(dbset.select(paginate=(2, 2)), serializer)
+    assert len(plain_calls) == 1
+    assert rv == expected
+    assert [row['title'] for row in rv] == ['task 2']
+
+
+@pytest.mark.parametrize('serializer_class', [
+    MethodSerializer, DunderSerializer, CallSerializer])
+def test_fallback_serializers(db, models, plain_calls, serializer_class):
+    serializer = serializer_class(models.Task)
+    with db.connection():
+        dbset = models.Task.all()
+        rv = serialize_select(dbset, serializer)
+        expected = serialize(dbset.select(), serializer)
+    assert not plain_calls
+    assert rv == expected
+
+
+def test_fallback_bind_to(db, models, plain_calls):
+    serializer = BoundSerializer(models.Task)
+    with db.connection():
+        dbset = db(models.Task.user == models.User.id)
+        rv = serialize_select(dbset, serializer)
+        expected = serialize(dbset.select(), serializer)
+    assert not plain_calls
+    assert rv == expected
+    assert rv[0]['title'] == 'task 0'
+
+
+def test_plain_set_subclass(db, models, plain_calls):
+    class CustomSet(Set):
+        pass
+
+    serializer = PlainSerializer(models.Task)
+    with db.connection():
+        dbset = CustomSet(db, models.Task.all().query, model=models.Task)
+        rv = serialize_select(dbset, serializer)
+        expected = serialize(dbset.select(), serializer)
+    assert len(plain_calls) == 1
+    assert rv == expected
+
+
+def test_plain_after_use_primary(app, models, replicas, plain_calls):
+    mod = app.rest_module(
+        __name__, 'plain_after_use_primary', models.Task,
+        url_prefix='plain_after_use_primary', enabled_methods=[],
+        read_replicas=replicas, serializer=PlainSerializer)
+
+    @mod.index()
+    def index(dbset):
+        mod.use_primary()
+        return mod.serialize_many_select(dbset)
+
+    rv = json.loads(app.test_client().get('/plain_after_use_primary').data)
+    assert len(plain_calls) == 1
+    assert rv['data'][0]['title'] == 'task 0'
+    assert rv['data'][0]['user'] == 1
+
+
+def test_fallback_joined_set(db, models, plain_calls):
+    serializer = PlainSerializer(models.Task)
+    with db.connection():
+        dbset = models.Task.all().join('user')
+        rv = serialize_select(dbset, serializer)
+        expected = serialize(dbset.select(), serializer)
+    assert not plain_calls
+    assert rv == expected
+
+
+def test_fallback_options(db, models, plain_calls):
+    serializer = PlainSerializer(models.Task)
+    cache = RamCache()
+    with db.connection():
+        dbset = models.Task.all()
+        expected = serialize(dbset.select(), serializer)
+        assert serialize_select(dbset, serializer, including='user') == \
+            expected
+        assert serialize_select(
+            dbset, serializer, cache=(cache, 300), cacheable=True) == \
+            expected
+    assert not plain_calls
+
+
+def test_index_envelope_override(app, models):
+    class MetaRESTModule(RESTModule):
+        def serialize_many_select(self, dbset, **options):
+            rv = super(MetaRESTModule, self).serialize_many_select(
+                dbset, **options)
+            rv['meta'] = {'count': len(rv[self.list_envelope])}
+            return rv
+
+    app.rest_module(
+        __name__, 'envelope_override', models.Task,
+        url_prefix='envelope_override', module_class=MetaRESTModule)
+    rv = json.loads(app.test_client().get('/envelope_override').data)
+    assert rv['meta'] == {'count': len(rv['data'])}
+
+
+def test_plain_allocations(db, models, many_tasks):
+    serializer = PlainSerializer(models.Task)
+
+    def measure(f):
+        tracemalloc.start()
+        try:
+            f()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    with db.connection():
+        dbset = models.Task.all()
+        assert serialize_select(dbset, serializer) == \
+            serialize(dbset.select(), serializer)
+        fast = measure(lambda: serialize_select(dbset, serializer))
+        slow = measure(lambda: serialize(dbset.select(), serializer))
+    assert fast < slow
@@ -1,4 +1,4 @@
 from .ext import REST
 from .appmodule import RESTModule
-from .serializers import Serializer, serialize
+from .serializers import Serializer, serialize, serialize_select
 from .parsers import Parser, parse_params_with_parser, parse_params
@@ -9,10 +9,13 @@
     :license: BSD, see LICENSE for more details.
 """
 
+from itertools import cycle
 from weppy import AppModule, sdict, request, response
+from weppy.orm.objects import Set
 from weppy.tools import ServicePipe
-from .helpers import SetFetcher, RecordFetcher
-from .serializers import serialize as _serialize
+from .helpers import SetFetcher, RecordFetcher, stick_to_primary
+from .serializers import (
+    serialize as _serialize, serialize_select as _serialize_select)
 from .parsers import (
     parse_params as _parse_params,
     parse_params_with_parser as _parse_params_wparser)
@@ -23,19 +26,20 @@ class RESTModule(AppModule):
     def from_app(
         cls, app, import_name, name, model, serializer, parser,
         enabled_methods, disabled_methods, list_envelope, single_envelope,
-        use_envelope_on_parsing, url_prefix, hostname
+        use_envelope_on_parsing, url_prefix, hostname, read_replicas=None
     ):
         return cls(
             app, name, import_name, model, serializer, parser,
             enabled_methods, disabled_methods, list_envelope, single_envelope,
-            use_envelope_on_parsing, url_prefix, hostname
+            use_envelope_on_parsing, url_prefix, hostname,
+            read_replicas=read_replicas
         )
 
     @classmethod
     def from_module(
         cls, mod, import_name, name, model, serializer, parser,
         enabled_methods, disabled_methods, list_envelope, single_envelope,
-        use_envelope_on_parsing, url_prefix, hostname
+        use_envelope_on_parsing, url_prefix, hostname, read_replicas=None
     ):
         if '.' in name:
             raise RuntimeError(
@@ -50,7 +54,8 @@ class RESTModule(AppModule):
         return cls(
             mod.app, name, import_name, model, serializer, parser,
             enabled_methods, disabled_methods, list_envelope, single_envelope,
-            use_envelope_on_parsing, module_url_prefix, hostname, mod.pipeline
+            use_envelope_on_parsing, module_url_prefix, hostname, mod.pipeline,
+            read_replicas
         )
 
     def __init__(
@@ -58,9 +63,10 @@ class RESTModule(AppModule):
         enabled_methods=['index', 'create', 'read', 'update', 'delete'],
         disabled_methods=[], list_envelope='data', single_envelope=None,
         use_envelope_on_parsing=False, url_prefix=None, hostname=None,
-        pipeline=[]
+        pipeline=[], read_replicas=None
     ):
         self._fetcher_method = self._get_dbset
+        self._replica_method = self._get_replica
         self._select_method = self._get_row
         self._after_parse = self._after_parse_params
         self.error_404 = self.build_error_404
@@ -97,9 +103,13 @@ class RESTModule(AppModule):
         self.list_envelope = list_envelope
         self.use_envelope_on_parsing = use_envelope_on_parsing
         self.single_envelope = single_envelope
-        self.index_pipeline = [SetFetcher(self)]
+        self.read_replicas = list(
+            read_replicas if read_replicas is not None else
+            self.ext.config.read_replicas)
+        self.index_pipeline = [SetFetcher(self, use_replica=True)]
         self.create_pipeline = []
-        self.read_pipeline = [SetFetcher(self), RecordFetcher(self)]
+        self.read_pipeline = [
+            SetFetcher(self, use_replica=True), RecordFetcher(self)]
         self.update_pipeline = [SetFetcher(self)]
         self.delete_pipeline = [SetFetcher(self)]
         self.init()
@@ -119,6 +129,20 @@ class RESTModule(AppModule):
                 self.parser.envelope = self.single_envelope
                 self._parsing_params_kwargs = \
                     {'evenlope': self.single_envelope}
+        #: mirror model tables on read replicas
+        for replica in self.read_replicas:
+            self._mirror_table_on(replica, self.model.table)
+        self._replicas_cycle = cycle(self.read_replicas)
+        #: stick to primary database after writes on any table
+        if self.read_replicas:
+            for tablename in self.model.db.tables:
+                table = self.model.db[tablename]
+                for callbacks in (
+                    table._after_insert, table._after_update,
+                    table._after_delete
+                ):
+                    if stick_to_primary not in callbacks:
+                        callbacks.append(stick_to_primary)
         #: adjust enabled methods
         for method_name in self.disabled_methods:
             self.enabled_methods.remove(method_name)
@@ -142,6 +166,34 @@ class RESTModule(AppModule):
     def _get_row(self, dbset):
         return dbset.select(limitby=(0, 1)).first()
 
+    def _get_replica(self):
+        return next(self._replicas_cycle)
+
+    def _mirror_table_on(self, replica, table):
+        if table._tablename in replica:
+            return
+        mirror = replica.define_table(
+            table._tablename, table, migrate=False,
+            table_class=table.__class__)
+        mirror._model_ = table._model_
+        #: referenced tables are needed to parse reference values
+        for field in table:
+            if field._itype not in ('reference', 'list:reference'):
+                continue
+            rtablename = field.type.split(' ')[1].split('.')[0]
+            self._mirror_table_on(replica, table._db[rtablename])
+
+    def _replica_bindable(self, dbset):
+        return type(dbset) is Set
+
+    def use_primary(self):
+        stick_to_primary()
+
+    @property
+    def _replicas_allowed(self):
+        return bool(self.read_replicas) and \
+            not getattr(request, '_weppy_rest_use_primary_', False)
+
     def get_pagination(self):
         try:
             page = int(request.query_params[self._pagination.page_param] or 1)
@@ -169,9 +221,15 @@ class RESTModule(AppModule):
     def serialize(self, data, **extras):
         return _serialize(data, self.serializer, **extras)
 
+    def serialize_select(self, dbset, **options):
+        return _serialize_select(dbset, self.serializer, **options)
+
     def serialize_with_list_envelope(self, data, **extras):
         return {self.list_envelope: self.serialize(data, **extras)}
 
+    def serialize_many_select(self, dbset, **options):
+        return {self.list_envelope: self.serialize_select(dbset, **options)}
+
     def serialize_with_single_envelope(self, data, **extras):
         return {self.single_envelope: self.serialize(data, **extras)}
 
@@ -188,8 +246,8 @@ class RESTModule(AppModule):
 
     #: default routes
     def _index(self, dbset):
-        rows = dbset.select(paginate=self.get_pagination())
-        return self.serialize_many(rows)
+        return self.serialize_many_select(
+            dbset, paginate=self.get_pagination())
 
     def _read(self, row):
         return self.serialize_one(row)
@@ -230,6 +288,10 @@ class RESTModule(AppModule):
         self._select_method = f
         return f
 
+    def get_replica(self, f):
+        self._replica_method = f
+        return f
+
     def index(self, pipeline=[]):
         pipeline = self.index_pipeline + pipeline
         return self.route(
@@ -28,7 +28,8 @@ class REST(Extension):
         max_pagesize=25,
         default_pagesize=20,
         base_path='/',
-        base_id_path='/<int:rid>'
+        base_id_path='/<int:rid>',
+        read_replicas=[]
     )
 
     def __init__(self, *args, **kwargs):
@@ -66,13 +67,16 @@ def rest_module_from_app(
     enabled_methods=['index', 'create', 'read', 'update', 'delete'],
     disabled_methods=[], list_envelope='data', single_envelope=None,
     use_envelope_on_parsing=False, url_prefix=None, hostname=None,
-    module_class=None
+    module_class=None, read_replicas=None
 ):
     module_class = module_class or app.ext.REST.config.default_module_class
+    kwargs = {}
+    if read_replicas is not None:
+        kwargs['read_replicas'] = read_replicas
     return module_class.from_app(
         app, import_name, name, model, serializer, parser, enabled_methods,
         disabled_methods, list_envelope, single_envelope,
-        use_envelope_on_parsing, url_prefix, hostname
+        use_envelope_on_parsing, url_prefix, hostname, **kwargs
     )
 
 
@@ -81,11 +85,14 @@ def rest_module_from_module(
     enabled_methods=['index', 'create', 'read', 'update', 'delete'],
     disabled_methods=[], list_envelope='data', single_envelope=None,
     use_envelope_on_parsing=False, url_prefix=None, hostname=None,
-    module_class=None
+    module_class=None, read_replicas=None
 ):
     module_class = module_class or mod.app.ext.REST.config.default_module_class
+    kwargs = {}
+    if read_replicas is not None:
+        kwargs['read_replicas'] = read_replicas
     return module_class.from_module(
         mod, import_name, name, model, serializer, parser, enabled_methods,
         disabled_methods, list_envelope, single_envelope,
-        use_envelope_on_parsing, url_prefix, hostname
+        use_envelope_on_parsing, url_prefix, hostname, **kwargs
     )
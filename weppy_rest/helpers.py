@@ -10,17 +10,28 @@
 """
 
 from functools import wraps
-from weppy import response
+from weppy import request, response
+from weppy.orm.objects import Set
 from weppy.pipeline import Pipe
 
 
 class SetFetcher(Pipe):
-    def __init__(self, mod):
+    def __init__(self, mod, use_replica=False):
         self.mod = mod
+        self.use_replica = use_replica
 
     def pipe(self, next_pipe, **kwargs):
         kwargs['dbset'] = self.mod._fetcher_method()
-        return next_pipe(**kwargs)
+        if not (
+            self.use_replica and self.mod._replicas_allowed and
+            self.mod._replica_bindable(kwargs['dbset'])
+        ):
+            return next_pipe(**kwargs)
+        replica = self.mod._replica_method()
+        kwargs['dbset'] = ReplicaSet._from_set(
+            kwargs['dbset'], replica, self.mod)
+        with replica.connection():
+            return next_pipe(**kwargs)
 
 
 class RecordFetcher(Pipe):
@@ -44,6 +55,74 @@ class RecordFetcher(Pipe):
         del kwargs['dbset']
 
 
+class ReplicaSet(Set):
+    @classmethod
+    def _from_set(cls, obj, replica, mod):
+        rv = cls(
+            replica, obj.query, obj.query.ignore_common_filters, obj._model_)
+        rv._primary_db_ = obj.db
+        rv._mod_ = mod
+        return rv
+
+    def _clone(self, ignore_common_filters=None, model=None, **changes):
+        rv = super(ReplicaSet, self)._clone(
+            ignore_common_filters, model, **changes)
+        rv._primary_db_ = self._primary_db_
+        rv._mod_ = self._mod_
+        return rv
+
+    def _on_primary(self):
+        return Set(
+            self._primary_db_, self.query, self.query.ignore_common_filters,
+            self._model_)
+
+    def _reading_set(self):
+        if self._mod_._replicas_allowed:
+            return super(ReplicaSet, self)
+        return self._on_primary()
+
+    def select(self, *fields, **options):
+        if any(options.get(key) for key in ('including', 'left', 'join')):
+            return self._on_primary().select(*fields, **options)
+        return self._reading_set().select(*fields, **options)
+
+    def iterselect(self, *fields, **options):
+        return self._reading_set().iterselect(*fields, **options)
+
+    def nested_select(self, *fields, **options):
+        return self._reading_set().nested_select(*fields, **options)
+
+    def count(self, distinct=None, cache=None):
+        return self._reading_set().count(distinct=distinct, cache=cache)
+
+    def isempty(self):
+        return self._reading_set().isempty()
+
+    def join(self, *args):
+        return self._on_primary().join(*args)
+
+    def update(self, **update_fields):
+        self._mod_.use_primary()
+        return self._on_primary().update(**update_fields)
+
+    def update_naive(self, **update_fields):
+        self._mod_.use_primary()
+        return self._on_primary().update_naive(**update_fields)
+
+    def validate_and_update(self, **update_fields):
+        self._mod_.use_primary()
+        return self._on_primary().validate_and_update(**update_fields)
+
+    def delete(self):
+        self._mod_.use_primary()
+        return self._on_primary().delete()
+
+
+def stick_to_primary(*args):
+    if request:
+        request._weppy_rest_use_primary_ = True
+
+
 def wrap_method_on_obj(method, obj):
     @wraps(method)
     def wrapped(*args, **kwargs):
@@ -10,7 +10,7 @@
 """
 
 from weppy._compat import iteritems
-from weppy.orm.objects import Rows
+from weppy.orm.objects import Rows, Set, JoinedSet
 
 
 class Serializer(object):
@@ -47,6 +47,13 @@ class Serializer(object):
                 _attrs_override_.append(key)
         self._attrs_override_ = _attrs_override_
         self._init()
+        #: plain serializers can skip rows objects on selects
+        self._plain_ = (
+            bool(self.attributes) and not self._attrs_override_ and
+            not self.bind_to and
+            type(self).__serialize__ == Serializer.__serialize__ and
+            type(self).__call__ == Serializer.__call__ and
+            all(key in self._model.table.fields for key in self.attributes))
 
     def _init(self):
         pass
@@ -73,3 +80,38 @@ def serialize(objects, serializer, **extras):
     elif not isinstance(objects, (Rows, list, tuple)):
         return serialize([objects], serializer, **extras)[0]
     return [serializer(obj, **extras) for obj in objects]
+
+
+def _build_plain_processor(names):
+    def processor(rows, fields, colnames, cacheable=False):
+        adapter = fields[0].db._adapter
+        fdata = [(field._itype, field.type, field.filter_out)
+                 for field in fields]
+        rv = []
+        for row in rows:
+            values = []
+            for value, (fit, ft, filter_out) in zip(row, fdata):
+                value = adapter.parse_value(value, fit, ft)
+                if filter_out:
+                    value = filter_out(value)
+                values.append(value)
+            rv.append(dict(zip(names, values)))
+        return rv
+    return processor
+
+
+def _plain_select_allowed(dbset, serializer, options):
+    return (
+        serializer._plain_ and isinstance(dbset, Set) and
+        not isinstance(dbset, JoinedSet) and
+        not any(options.get(key) for key in (
+            'including', 'left', 'join', 'cache', 'processor')))
+
+
+def serialize_select(dbset, serializer, **options):
+    if not _plain_select_allowed(dbset, serializer, options):
+        return serialize(dbset.select(**options), serializer)
+    table = serializer._model.table
+    options['processor'] = _build_plain_processor(serializer.attributes)
+    return dbset.select(
+        *[table[key] for key in serializer.attributes], **options)